@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, Depends
 from ..services.url_service import UrlService
 from ..repositories.url_repository import UrlRepository
@@ -15,26 +15,26 @@ class AdminController:
     def __init__(self, url_service: UrlService):
         self.url_service = url_service
     
-    def get_statistics(self, limit: int = 20) -> AdminStatsView:
+    async def get_statistics(self, limit: int = 20) -> AdminStatsView:
         """
         Get statistics of the most popular URLs
         """
         try:
-            url_objects = self.url_service.get_stats(limit)
+            rows = await self.url_service.get_stats(limit)
             
-            # Convert URL model objects to UrlStatsView objects
-            stats_views = []
-            for url_obj in url_objects:
-                stats_view = UrlStatsView(
-                    id=url_obj.id,
-                    target_url=url_obj.target_url,
-                    clicks=url_obj.clicks,
-                    created_at=url_obj.created_at,
-                    short_url=f"/url/{url_obj.id}"
+            # Build UrlStatsView objects straight from the selected columns, trusting the database values
+            stats_views = [
+                UrlStatsView.model_construct(
+                    id=row.id,
+                    target_url=row.target_url,
+                    clicks=row.clicks,
+                    created_at=row.created_at,
+                    short_url=row.short_url
                 )
-                stats_views.append(stats_view)
+                for row in rows
+            ]
             
-            return AdminStatsView(
+            return AdminStatsView.model_construct(
                 top_urls=stats_views,
                 total=len(stats_views),
                 limit=limit
@@ -42,22 +42,17 @@ class AdminController:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error getting statistics: {str(e)}")
     
-    def delete_url(self, short_id: str) -> DeleteUrlResponse:
+    async def delete_url(self, short_id: str) -> DeleteUrlResponse:
         """
         Delete a shortened URL
         """
         try:
-            # Check if the URL exists
-            url_data = self.url_service.get_short_url(short_id)
-            if not url_data:
+            # Delete the URL, which also reports whether it existed
+            deleted = await self.url_service.delete_url(short_id)
+            if not deleted:
                 raise HTTPException(status_code=404, detail="URL not found")
             
-            # Delete the URL
-            success = self.url_service.delete_url(short_id)
-            if not success:
-                raise HTTPException(status_code=500, detail="Failed to delete URL")
-            
-            return DeleteUrlResponse(
+            return DeleteUrlResponse.model_construct(
                 message="URL deleted successfully",
                 deleted_id=short_id
             )
@@ -69,7 +64,7 @@ class AdminController:
 
 
 # Factory function to create the controller with dependencies
-def get_admin_controller(db: Session = Depends(get_db)) -> AdminController:
+async def get_admin_controller(db: AsyncSession = Depends(get_db)) -> AdminController:
     """
     Factory function to create AdminController with its dependencies
     """
@@ -1,7 +1,7 @@
 from ..services.url_service import UrlService
 from ..models.url import URLBase, URLInfo
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.url_repository import UrlRepository
 from ..database import get_db
 
@@ -13,55 +13,46 @@ class UrlController:
     def __init__(self, url_service: UrlService):
         self.url_service = url_service
 
-    def create_short_url(self, url: URLBase) -> URLInfo:
+    async def create_short_url(self, url: URLBase) -> URLInfo:
         """
         Create a short URL
         """
         try:
-            created_url = self.url_service.create_short(url)
-            return URLInfo(
+            created_url = await self.url_service.create_short(url)
+            # Data comes from the database, so Pydantic validation is skipped
+            return URLInfo.model_construct(
                 id=created_url.id,
                 target_url=created_url.target_url,
-                short_url=f"/url/{created_url.id}"
+                short_url=created_url.short_url
             )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
     
-    def get_short_url(self, short_id: str) -> URLInfo:
+    async def get_short_url(self, short_id: str) -> URLInfo:
         """
         Get a short URL
         """
-        url = self.url_service.get_short_url(short_id)
+        url = await self.url_service.get_short_url(short_id)
         if not url:
             raise HTTPException(status_code=404, detail="URL not found")
         
-        return URLInfo(
+        return URLInfo.model_construct(
             id=url.id,
             target_url=url.target_url,
-            short_url=f"/url/{url.id}"
+            short_url=url.short_url
         )
     
-    def increment_clicks(self, short_id: str) -> None:
+    async def redirect_target_url(self, short_id: str) -> str:
         """
-        Increment the clicks of a short URL
+        Return the target URL of a short URL, counting the click
         """
-        return self.url_service.increment_clicks(short_id)
-    
-    
-    def redirect_target_url(self, short_id: str) -> str:
-        """
-        Return the target URL of a short URL
-        """
-        target_url = self.url_service.return_target_url(short_id)
+        target_url = await self.url_service.resolve_target_url(short_id)
         if not target_url:
             raise HTTPException(status_code=404, detail="URL not found")
         
-        # Increment clicks when URL is accessed
-        self.increment_clicks(short_id)
-        
         return target_url
     
-def get_url_controller(db: Session = Depends(get_db)) -> UrlController:
+async def get_url_controller(db: AsyncSession = Depends(get_db)) -> UrlController:
     """
     Factory function to create UrlController with its dependencies
     """
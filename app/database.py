@@ -1,21 +1,152 @@
 import os
-from sqlalchemy import create_engine
+from dotenv import load_dotenv
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.sql.dml import UpdateBase
 
-DATABASE_URL = f"sqlite:///{os.path.join(os.path.dirname(__file__), '..', 'shortener.db')}"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+load_dotenv()
+
+DEFAULT_DATABASE_URL = f"sqlite+aiosqlite:///{os.path.join(os.path.dirname(__file__), '..', 'shortener.db')}"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+# Serverless instances are frozen between requests, so pooled connections would go stale
+DB_SERVERLESS = os.getenv("DB_SERVERLESS", "false").lower() == "true"
+
+
+def get_database_url():
+    url = make_url(os.getenv("DATABASE_URL") or DEFAULT_DATABASE_URL)
+    # Hosting providers hand out postgres:// URLs; route them through the asyncpg driver
+    if url.drivername in ("postgres", "postgresql"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+DATABASE_URL = get_database_url()
+IS_SQLITE = DATABASE_URL.get_backend_name() == "sqlite"
+
+# In-memory databases have no journal file to switch to WAL
+IS_FILE_DB = IS_SQLITE and DATABASE_URL.database not in (None, "", ":memory:")
+
+if IS_SQLITE:
+    # SQLite allows a single writer at a time, so writes go through one dedicated connection
+    write_engine = create_async_engine(
+        DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0
+    )
+
+    # Long-lived pooled read connections keep SQLite's page cache warm between requests.
+    # An in-memory database only exists inside one connection, so it can't be split.
+    read_engine = create_async_engine(
+        DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW
+    ) if IS_FILE_DB else write_engine
+else:
+    # Cache prepared statements for the handful of hot queries, and skip JIT
+    # compilation, which only slows down small OLTP queries like these
+    connect_args = {
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off"}
+    }
+    # PostgreSQL handles concurrent writers itself, so one engine serves reads and writes
+    if DB_SERVERLESS:
+        write_engine = read_engine = create_async_engine(
+            DATABASE_URL,
+            poolclass=NullPool,
+            connect_args=connect_args
+        )
+    else:
+        write_engine = read_engine = create_async_engine(
+            DATABASE_URL,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args=connect_args
+        )
 
 Base = declarative_base()
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
+# Per-connection settings: NORMAL sync is durable under WAL and avoids an fsync per commit,
+# while the 256MB mmap and 32MB page cache let pooled connections serve reads from memory
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-32000",
+)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def set_sqlite_read_pragmas(dbapi_connection, connection_record):
+    set_sqlite_pragmas(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=true")
+    cursor.close()
+
+
+if IS_SQLITE:
+    event.listen(write_engine.sync_engine, "connect", set_sqlite_pragmas)
+    if read_engine is not write_engine:
+        event.listen(read_engine.sync_engine, "connect", set_sqlite_read_pragmas)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends INSERT/UPDATE/DELETE and ORM flushes to the writer
+    and every other statement to the read-only pool
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            return write_engine.sync_engine
+        return read_engine.sync_engine
+
+
+SessionLocal = async_sessionmaker(sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False)
+
+
+def create_missing_indexes(connection):
+    # create_all skips tables that already exist, so indexes added later are created here.
+    # SQLite only: on PostgreSQL a plain CREATE INDEX blocks writes while it builds and
+    # workers starting together race on it, so indexes there are created by hand (see README).
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+async def init_db():
+    if IS_FILE_DB:
+        # journal_mode is persisted in the database file, so it only needs to be set once
+        async with write_engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    async with write_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if IS_SQLITE:
+            await conn.run_sync(create_missing_indexes)
+
+
+async def close_db():
+    # Closes the pooled connections so the process exits without leaving them to the garbage collector
+    await write_engine.dispose()
+    if read_engine is not write_engine:
+        await read_engine.dispose()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,5 +1,6 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hmac
 import os
 from dotenv import load_dotenv
 
@@ -8,13 +9,15 @@ security = HTTPBearer()
 class AdminToken:
     def __init__(self):
         load_dotenv()
-        self.__token = os.getenv("ADMIN_API_TOKEN")
-        if not self.__token:
+        token = os.getenv("ADMIN_API_TOKEN")
+        if not token:
             raise RuntimeError("Admin token not configured")
+        # Encoded once here so each request only pays for the constant-time compare
+        self.__token = token.encode()
 
-    def __call__(self, credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    async def __call__(self, credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
         token = credentials.credentials
-        if token != self.__token:
+        if not hmac.compare_digest(token.encode(), self.__token):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token or insufficient permissions",
@@ -1,7 +1,18 @@
+import os
+from dotenv import load_dotenv
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+load_dotenv()
+
+# memory:// keeps counters per worker; point this at Redis (redis://host:6379) to share them across workers
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="fixed-window"
+)
 
 DEFAULT_LIMITS = {
     "general": "100/minute",
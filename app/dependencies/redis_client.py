@@ -0,0 +1,18 @@
+import os
+from dotenv import load_dotenv
+from redis.asyncio import Redis
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+# Seconds to wait on connect or on a reply. A stalled Redis then raises TimeoutError quickly
+# and callers fall back to the database and in-memory counters instead of hanging redirects.
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", 0.5))
+
+# Shared by the redirect cache and the click counters; without it both stay in-process
+redis_client = Redis.from_url(
+    REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=REDIS_TIMEOUT,
+    socket_timeout=REDIS_TIMEOUT
+) if REDIS_URL else None
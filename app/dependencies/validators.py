@@ -1,8 +1,53 @@
 import re
+import string
 import unicodedata
 import validators
+from functools import lru_cache
 from typing import Optional, Tuple
 
+
+class _AllowedAliasChars(dict):
+    """str.translate table that keeps letters, digits, hyphens and underscores and deletes everything else"""
+
+    def __missing__(self, codepoint: int) -> None:
+        return None
+
+
+_ALIAS_CHARS = _AllowedAliasChars((ord(char), char) for char in string.ascii_letters + string.digits + '-_')
+
+# Compiled once at import instead of on every request
+_DUPSEP = re.compile(r'[-_]{2,}')
+
+# Paths that can't be used as short IDs because they clash with routes or common pages
+RESERVED_PATHS: frozenset[str] = frozenset({
+    "", "shorten", "stats", "docs", "ping",
+    # Authentication
+    "login", "register", "auth", "signin", "signup", "logout",
+    # API and Next.js
+    "api", "_next", "_vercel", "vercel",
+    # Static assets
+    "favicon", "favicon.ico", "robots", "robots.txt", "sitemap", "sitemap.xml",
+    # Main pages of the user
+    "home", "dashboard", "profile", "settings", "admin", "user", "account",
+    # Institutional pages
+    "about", "contact", "help", "support", "terms", "privacy", "policy",
+    # System resources
+    "public", "static", "assets", "images", "img", "css", "js", "fonts",
+    # Error pages
+    "404", "500", "error", "not-found",
+    # Webhooks and integrations
+    "webhook", "webhooks", "callback", "oauth",
+    # Monitoring and system
+    "health", "status", "metrics", "monitoring",
+    # Other common paths
+    "www", "mail", "email", "ftp", "blog", "news", "shop", "store",
+    # Admin area
+    "administrator", "manage", "management", "console", "root",
+    # Additional resources
+    "download", "upload", "file", "files", "media"
+})
+
+
 class URLValidator:
     """URL validation utilities"""
     
@@ -12,6 +57,7 @@ class URLValidator:
         return validators.url(url)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def sanitize_alias(alias: str) -> str:
         """Sanitize the alias removing special characters and applying security rules"""
         if not alias:
@@ -23,18 +69,12 @@ class URLValidator:
         # Convert to lowercase
         alias = alias.lower()
 
-        # Remove accents and normalize unicode characters
-        alias = unicodedata.normalize('NFD', alias)
-        alias = ''.join(char for char in alias if unicodedata.category(char) != 'Mn')
-
-        # Remove characters not allowed (keep only letters, numbers, hyphens and underscores)
-        alias = re.sub(r'[^a-zA-Z0-9\-_]', '', alias)
-
-        # Remove multiple hyphens/underscores consecutively
-        alias = re.sub(r'[-_]{2,}', '-', alias)
+        # Decompose accented characters, then keep only letters, numbers, hyphens and underscores.
+        # The accents become combining marks, which the translate table drops with everything else.
+        alias = unicodedata.normalize('NFD', alias).translate(_ALIAS_CHARS)
 
-        # Remove hyphens/underscores at the beginning and end
-        alias = re.sub(r'^[-_]+|[-_]+$', '', alias)
+        # Collapse consecutive hyphens/underscores and remove them at the beginning and end
+        alias = _DUPSEP.sub('-', alias).strip('-_')
 
         # Limit the size (maximum 50 characters)
         alias = alias[:50]
@@ -42,62 +82,20 @@ class URLValidator:
         return alias
 
     @staticmethod
-    def validate_alias(alias: str) -> Tuple[bool, Optional[str]]:
-        """Validate the sanitized alias. Returns: (is_valid, error_message)"""
-        sanitized = URLValidator.sanitize_alias(alias)
-
+    def validate_sanitized_alias(sanitized: str) -> Tuple[bool, Optional[str]]:
+        """Validate an alias already returned by sanitize_alias. Returns: (is_valid, error_message)"""
         if not sanitized:
             return False, "Alias cannot be empty after sanitization"
 
         if len(sanitized) < 2:
             return False, "Alias must have at least 2 characters"
 
-        # Check if it is only numbers
-        if re.match(r'^\d+$', sanitized):
+        # Sanitized aliases are ASCII only, so isdigit() matches exactly the numeric ones
+        if sanitized.isdigit():
             return False, "Alias cannot be only numbers"
 
-        # Check suspicious patterns
-        suspicious_patterns = [
-            r'^(admin|root|api|www|mail)$',  # System names
-            r'^\d+$',  # Only numbers
-            r'^[_-]+$',  # Only symbols
-        ]
-
-        for pattern in suspicious_patterns:
-            if re.match(pattern, sanitized):
-                return False, "This alias pattern is not allowed"
+        # System names are part of the reserved paths, so one lookup covers both
+        if sanitized in RESERVED_PATHS:
+            return False, "This ID is reserved and cannot be used"
 
         return True, None
-    
-    @staticmethod
-    def check_reserved_paths(short_id: str) -> bool:
-        """Check if the ID is in the list of reserved paths"""
-        reserved_paths = [
-            "", "shorten", "stats", "docs", "ping",
-            # Authentication
-            "login", "register", "auth", "signin", "signup", "logout",
-            # API and Next.js
-            "api", "_next", "_vercel", "vercel",
-            # Static assets
-            "favicon", "favicon.ico", "robots", "robots.txt", "sitemap", "sitemap.xml",
-            # Main pages of the user
-            "home", "dashboard", "profile", "settings", "admin", "user", "account",
-            # Institutional pages
-            "about", "contact", "help", "support", "terms", "privacy", "policy",
-            # System resources
-            "public", "static", "assets", "images", "img", "css", "js", "fonts",
-            # Error pages
-            "404", "500", "error", "not-found",
-            # Webhooks and integrations
-            "webhook", "webhooks", "callback", "oauth",
-            # Monitoring and system
-            "health", "status", "metrics", "monitoring", "ping",
-            # Other common paths
-            "www", "mail", "email", "ftp", "blog", "news", "shop", "store",
-            # Admin area
-            "administrator", "manage", "management", "console",
-            # Additional resources
-            "download", "upload", "file", "files", "media"
-        ]
-        
-        return short_id in reserved_paths 
\ No newline at end of file
@@ -1,18 +1,25 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import logging
 import os
 from dotenv import load_dotenv
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from app.dependencies.limiter import limiter
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from app.routes.admin_routes import admin_router
 from app.routes.url_routes import url_router
-from app.database import init_db
+from app.database import close_db, init_db
+from app.dependencies.redis_client import redis_client
+from app.services.click_buffer import click_buffer
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 PORT = int(os.getenv("PORT", 8000))
 HOST = os.getenv("HOST", "0.0.0.0")
 ENV = os.getenv("ENV", "development")  # development, staging, production
@@ -23,15 +30,29 @@ async def lifespan(app: FastAPI):
     """
     Lifespan event handler to initialize resources on startup.
     """
-    init_db()
+    await init_db()
+    click_flusher = asyncio.create_task(click_buffer.run())
     yield
+    # Stop the periodic flush and write whatever clicks are still pending
+    click_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await click_flusher
+    try:
+        await click_buffer.flush()
+    except Exception:
+        logger.exception("Failed to flush buffered clicks on shutdown")
+    finally:
+        await close_db()
+        if redis_client:
+            await redis_client.aclose()
 
 
 app = FastAPI(
     title="Zipway - Url Shortener", 
     description="A simple and efficient URL shortening service", 
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.state.limiter = limiter
@@ -1,17 +1,47 @@
-from sqlalchemy import Column, String, Integer, DateTime, func
+import os
+from sqlalchemy import Column, String, Integer, DateTime, Index, func, literal
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.database import Base
-from pydantic import BaseModel, Field
+from app.dependencies.validators import URLValidator
+from pydantic import BaseModel, Field, field_validator
+from pydantic_core import PydanticCustomError
 from typing import Optional
 
+# Resolved once at import; an empty PUBLIC_API_URL keeps short URLs relative to the API.
+# Deployments use BASE_URL for the frontend, so the API origin has its own variable.
+PUBLIC_API_URL = os.getenv("PUBLIC_API_URL", "").rstrip("/")
+SHORT_URL_PREFIX = f"{PUBLIC_API_URL}/url/"
+
 # Pydantic
 
 class URLBase(BaseModel):
     target_url: str
-    custom_id: Optional[str] = Field(None, alias="short_id")
+    # Bounded because sanitize_alias caches its raw input; aliases are cut to 50 characters anyway
+    custom_id: Optional[str] = Field(None, alias="short_id", max_length=200)
 
     class Config:
         validate_by_name = True
 
+    @field_validator("target_url")
+    @classmethod
+    def check_target_url(cls, target_url: str) -> str:
+        if not URLValidator.validate_url(target_url):
+            raise PydanticCustomError("invalid_url", "Invalid URL provided")
+        return target_url
+
+    @field_validator("custom_id")
+    @classmethod
+    def sanitize_custom_id(cls, custom_id: Optional[str]) -> Optional[str]:
+        """Replace the requested alias with its sanitized form, rejecting unusable ones"""
+        if not custom_id:
+            return None
+
+        sanitized_id = URLValidator.sanitize_alias(custom_id)
+        is_valid, error_message = URLValidator.validate_sanitized_alias(sanitized_id)
+        if not is_valid:
+            raise PydanticCustomError("invalid_alias", error_message)
+        return sanitized_id
+
 
 class URLInfo(BaseModel):
     id: str
@@ -28,4 +58,17 @@ class URL(Base):
     id = Column(String, primary_key=True, index=True)
     target_url = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    clicks = Column(Integer, default=0)
\ No newline at end of file
+    clicks = Column(Integer, default=0)
+
+    @hybrid_property
+    def short_url(self) -> str:
+        return SHORT_URL_PREFIX + self.id
+
+    @short_url.expression
+    def short_url(cls):
+        # Concatenated by the database when selected as a column
+        return (literal(SHORT_URL_PREFIX) + cls.id).label("short_url")
+
+
+# Lets the stats query walk the top clicked URLs in order instead of sorting the table
+Index("idx_urls_clicks_desc", URL.clicks.desc(), URL.id)
@@ -1,43 +1,84 @@
-from sqlalchemy.orm import Session
+from itertools import islice
+from typing import Dict, Sequence
 
+from sqlalchemy import Integer, Row, String, column, delete, select, update, values
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import IS_SQLITE
 from ..models.url import URL
 
+# Both dialects support INSERT ... ON CONFLICT with RETURNING
+insert = sqlite.insert if IS_SQLITE else postgresql.insert
+
+# Short IDs per click UPDATE, keeping the bound parameters well under SQLite's limit
+CLICK_BATCH_SIZE = 500
+
+# Hot redirect queries run as Core statements on the table, skipping ORM hydration and the identity map
+urls = URL.__table__
+
 
 class UrlRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, url: URL) -> URL:
-        self.db.add(url)
-        self.db.commit()
-        self.db.refresh(url)
-        return url
-
-    def get(self, short_id: str) -> URL | None:
-        return self.db.query(URL).filter(URL.id == short_id).first()
-
-    def increment_clicks(self, short_id: str) -> None:
-        short_url = self.get(short_id)
-        if short_url:
-            short_url.clicks += 1
-            self.db.commit()
-
-    def exists(self, short_id: str) -> bool:
-        return self.db.query(URL.id).filter(URL.id == short_id).first() is not None
-
-    def stats(self, limit: int = 20):
-        return self.db.query(URL).order_by(URL.clicks.desc()).limit(limit).all()
-
-    def delete(self, short_id: str) -> bool:
-        short_url = self.get(short_id)
-        if short_url:
-            self.db.delete(short_url)
-            self.db.commit()
-            return True
-        return False
-
-    def return_target_url(self, short_id: str) -> str | None:
-        short_url = self.get(short_id)
-        if short_url:
-            return short_url.target_url
-        return None
+    async def create_unique(self, short_id: str, target_url: str) -> URL | None:
+        """Insert a URL unless the ID is taken, returning None on conflict"""
+        stmt = (
+            insert(URL)
+            .values(id=short_id, target_url=target_url)
+            .on_conflict_do_nothing(index_elements=[URL.id])
+            .returning(URL)
+        )
+        created = (await self.db.scalars(stmt)).first()
+        await self.db.commit()
+        return created
+
+    async def get(self, short_id: str) -> URL | None:
+        return await self.db.get(URL, short_id)
+
+    async def resolve_and_bump(self, short_id: str) -> str | None:
+        """Count a click and return the target URL in one UPDATE ... RETURNING"""
+        target_url = await self.db.scalar(
+            update(urls)
+            .where(urls.c.id == short_id)
+            .values(clicks=urls.c.clicks + 1)
+            .returning(urls.c.target_url)
+        )
+        await self.db.commit()
+        return target_url
+
+    async def add_clicks(self, clicks: Dict[str, int]) -> None:
+        """Add a batch of click counts with one UPDATE ... FROM (VALUES ...) per CLICK_BATCH_SIZE IDs"""
+        # Every flusher locks rows in the same id order, so concurrent flushes can't deadlock
+        items = iter(sorted(clicks.items()))
+        while batch := list(islice(items, CLICK_BATCH_SIZE)):
+            # A CTE rather than an aliased subquery, since SQLite can't name derived table columns
+            pending = values(
+                column("id", String), column("count", Integer), name="pending"
+            ).data(batch).cte("pending")
+            await self.db.execute(
+                update(urls)
+                .where(urls.c.id == pending.c.id)
+                .values(clicks=urls.c.clicks + pending.c.count)
+            )
+        await self.db.commit()
+
+    async def stats(self, limit: int = 20) -> Sequence[Row]:
+        """Top clicked URLs as plain rows, without loading ORM entities"""
+        # Ordering by the full idx_urls_clicks_desc key keeps ties stable and still walks the index
+        result = await self.db.execute(
+            select(urls.c.id, urls.c.target_url, urls.c.clicks, urls.c.created_at, URL.short_url)
+            .order_by(urls.c.clicks.desc(), urls.c.id)
+            .limit(limit)
+        )
+        return result.all()
+
+    async def delete(self, short_id: str) -> bool:
+        result = await self.db.execute(delete(URL).where(URL.id == short_id).returning(URL.id))
+        deleted = result.scalar_one_or_none() is not None
+        await self.db.commit()
+        return deleted
+
+    async def return_target_url(self, short_id: str) -> str | None:
+        return await self.db.scalar(select(urls.c.target_url).where(urls.c.id == short_id))
@@ -14,14 +14,14 @@ admin_auth = AdminToken()
 async def get_statistics(
     request: Request,
     limit: int = 20,
-    token: str = Depends(admin_auth.__call__),
+    token: str = Depends(admin_auth),
     controller: AdminController = Depends(get_admin_controller)
 ):
     """
     Return user statistics of the most popular URLs.
     Requires admin token.
     """
-    return controller.get_statistics(limit)
+    return await controller.get_statistics(limit)
 
 
 @admin_router.delete("/delete-url", response_model=DeleteUrlResponse)
@@ -29,11 +29,11 @@ async def get_statistics(
 async def delete_short_url(
     request: Request,
     short_id: str = Query(..., description="The short ID of the URL to delete"),
-    token: str = Depends(admin_auth.__call__),
+    token: str = Depends(admin_auth),
     controller: AdminController = Depends(get_admin_controller)
 ):
     """
     Delete a shortened URL.
     Requires admin token.
     """
-    return controller.delete_url(short_id)
+    return await controller.delete_url(short_id)
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, Request, HTTPException
-from fastapi.responses import RedirectResponse
 
 from ..controllers.url_controller import get_url_controller, UrlController
 from ..dependencies.limiter import limiter, DEFAULT_LIMITS
 from ..models.url import URLBase
-from ..views.url_views import UrlCreateView
+from ..views.url_views import RedirectView, UrlCreateView
 
 url_router = APIRouter(prefix="/url", tags=["URLs"])
 
@@ -15,8 +14,8 @@ async def redirect_target_url(short_id: str, request: Request, controller: UrlCo
     Redirect to the target URL of a short URL
     """
     try:
-        target_url = controller.redirect_target_url(short_id)
-        return RedirectResponse(url=target_url, status_code=307)
+        target_url = await controller.redirect_target_url(short_id)
+        return RedirectView(target_url)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -28,4 +27,4 @@ async def create_short_url(url: URLBase, request: Request, controller: UrlContro
     """
     Create a short URL
     """
-    return controller.create_short_url(url)
\ No newline at end of file
+    return await controller.create_short_url(url)
\ No newline at end of file
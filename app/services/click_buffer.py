@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import Counter
+from typing import Dict
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..database import SessionLocal
+from ..dependencies.redis_client import redis_client
+from ..repositories.url_repository import UrlRepository
+
+logger = logging.getLogger(__name__)
+
+CLICK_FLUSH_INTERVAL = float(os.getenv("CLICK_FLUSH_INTERVAL", 0.5))
+# A zero interval turns buffering off and every click is written as it happens
+CLICK_BUFFER_ENABLED = CLICK_FLUSH_INTERVAL > 0
+
+
+class ClickBuffer:
+    """
+    Write-behind buffer that counts redirect clicks in memory and
+    periodically writes them to the database in a single batch
+    """
+
+    def __init__(self):
+        self._clicks: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    async def add(self, short_id: str, count: int = 1) -> None:
+        """Count a click to be written on the next flush"""
+        with self._lock:
+            self._clicks[short_id] += count
+
+    async def drain(self) -> Dict[str, int]:
+        """Take the pending clicks, leaving the buffer empty"""
+        with self._lock:
+            clicks, self._clicks = self._clicks, Counter()
+        return clicks
+
+    async def flush(self) -> None:
+        """Write all pending clicks to the database"""
+        clicks = await self.drain()
+        if not clicks:
+            return
+
+        try:
+            async with SessionLocal() as db:
+                await UrlRepository(db).add_clicks(clicks)
+        except Exception:
+            # Put the counts back so they are retried on the next flush
+            for short_id, count in clicks.items():
+                await self.add(short_id, count)
+            raise
+
+    async def run(self, interval: float = CLICK_FLUSH_INTERVAL) -> None:
+        """Flush pending clicks every `interval` seconds until cancelled"""
+        if interval <= 0:
+            return
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered clicks")
+
+
+class RedisClickBuffer(ClickBuffer):
+    """
+    Click buffer kept in a Redis hash, so pending clicks are shared by every
+    worker and survive a worker restart. While Redis is unreachable, clicks
+    are counted in memory instead so redirects keep working and no click is lost
+    """
+
+    PENDING_KEY = "clicks_pending"
+
+    def __init__(self, redis: Redis):
+        super().__init__()
+        self.redis = redis
+
+    async def add(self, short_id: str, count: int = 1) -> None:
+        """Count a click to be written on the next flush"""
+        try:
+            await self.redis.hincrby(self.PENDING_KEY, short_id, count)
+        except RedisError:
+            logger.exception("Failed to buffer click in Redis, counting it in memory")
+            await super().add(short_id, count)
+
+    async def drain(self) -> Dict[str, int]:
+        """Take the pending clicks, leaving the hash and the in-memory fallback empty"""
+        clicks = await super().drain()
+        try:
+            # HGETALL and DEL run in one MULTI so no increment lands between them
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pending, _ = await pipe.hgetall(self.PENDING_KEY).delete(self.PENDING_KEY).execute()
+        except RedisError:
+            # Clicks left in the hash are picked up by a later flush
+            logger.exception("Failed to drain buffered clicks from Redis")
+            return clicks
+
+        for short_id, count in pending.items():
+            clicks[short_id] += int(count)
+        return clicks
+
+
+click_buffer = RedisClickBuffer(redis_client) if redis_client else ClickBuffer()
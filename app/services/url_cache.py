@@ -0,0 +1,80 @@
+import logging
+import os
+import threading
+
+from cachetools import TTLCache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..dependencies.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+URL_CACHE_SIZE = int(os.getenv("URL_CACHE_SIZE", 10_000))
+URL_CACHE_TTL = float(os.getenv("URL_CACHE_TTL", 300))
+REDIS_URL_CACHE_TTL = int(os.getenv("REDIS_URL_CACHE_TTL", 3600))
+
+
+class UrlCache:
+    """
+    In-process TTL LRU cache of short ID -> target URL lookups
+    """
+
+    def __init__(self, maxsize: int = URL_CACHE_SIZE, ttl: float = URL_CACHE_TTL):
+        self._cache: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    async def get(self, short_id: str) -> str | None:
+        """Return the cached target URL, or None on a miss"""
+        with self._lock:
+            return self._cache.get(short_id)
+
+    async def set(self, short_id: str, target_url: str) -> None:
+        """Cache the target URL of a short ID"""
+        with self._lock:
+            self._cache[short_id] = target_url
+
+    async def invalidate(self, short_id: str) -> None:
+        """Drop a short ID from the cache"""
+        with self._lock:
+            self._cache.pop(short_id, None)
+
+
+class RedisUrlCache:
+    """
+    Short ID -> target URL cache shared by every worker through Redis.
+    The cache is optional, so Redis errors are logged and treated as a miss
+    rather than failing the request
+    """
+
+    KEY_PREFIX = "url:"
+
+    def __init__(self, redis: Redis, ttl: int = REDIS_URL_CACHE_TTL):
+        self.redis = redis
+        self.ttl = ttl
+
+    async def get(self, short_id: str) -> str | None:
+        """Return the cached target URL, or None on a miss"""
+        try:
+            return await self.redis.get(self.KEY_PREFIX + short_id)
+        except RedisError:
+            logger.exception("Failed to read cached URL %s", short_id)
+            return None
+
+    async def set(self, short_id: str, target_url: str) -> None:
+        """Cache the target URL of a short ID"""
+        try:
+            await self.redis.set(self.KEY_PREFIX + short_id, target_url, ex=self.ttl)
+        except RedisError:
+            logger.exception("Failed to cache URL %s", short_id)
+
+    async def invalidate(self, short_id: str) -> None:
+        """Drop a short ID from the cache"""
+        try:
+            await self.redis.delete(self.KEY_PREFIX + short_id)
+        except RedisError:
+            # The entry can only outlive the row until its TTL runs out
+            logger.exception("Failed to invalidate cached URL %s", short_id)
+
+
+url_cache = RedisUrlCache(redis_client) if redis_client else UrlCache()
@@ -1,60 +1,83 @@
 from app.repositories.url_repository import UrlRepository
 from ..models.url import URL, URLBase
-from typing import List
-import shortuuid
-from ..dependencies.validators import URLValidator
+from typing import Sequence
+from sqlalchemy import Row
+import secrets
+import string
+from .click_buffer import CLICK_BUFFER_ENABLED, click_buffer
+from .url_cache import url_cache
+
+BASE62_ALPHABET = string.digits + string.ascii_letters
+SHORT_ID_LENGTH = 7
 
 class UrlService:
     def __init__(self, repo: UrlRepository):
         self.repo = repo
 
-    def create_short(self, url_data: URLBase):
-        if url_data.custom_id:
-            sanitized_id = URLValidator.sanitize_alias(url_data.custom_id)
-            is_valid, error_message = URLValidator.validate_alias(url_data.custom_id)
-            
-            if not is_valid:
-                raise ValueError(error_message)
-            
-            if self.url_exists(sanitized_id):
+    async def create_short(self, url_data: URLBase):
+        # URLBase has already validated the target URL and sanitized the custom ID
+        short_id = url_data.custom_id
+        if short_id:
+            # The conflict check and the insert are one statement, so two requests can't claim the same ID
+            created = await self.repo.create_unique(short_id, url_data.target_url)
+            if created is None:
                 raise ValueError("Custom ID already exists")
-            
-            if URLValidator.check_reserved_paths(sanitized_id):
-                raise ValueError("This ID is reserved and cannot be used")
-            
-            short_id = sanitized_id
-        else:
-            short_id = self.generate_short_id()
-        
-        if not URLValidator.validate_url(url_data.target_url):
-            raise ValueError("Invalid URL provided")
-        
-        return self.repo.create(URL(id=short_id, target_url=url_data.target_url))
 
-    def get_short_url(self, short_id: str):
-        return self.repo.get(short_id=short_id)
+            # A lookup racing an earlier delete of the same ID may have re-cached the old target
+            await url_cache.invalidate(short_id)
+            return created
+        return await self.create_with_random_id(url_data.target_url)
 
-    def increment_clicks(self, short_id: str):
-        return self.repo.increment_clicks(short_id=short_id)
+    async def get_short_url(self, short_id: str):
+        return await self.repo.get(short_id=short_id)
 
-    def url_exists(self, short_id: str):
-        return self.repo.exists(short_id)
+    async def increment_clicks(self, short_id: str) -> None:
+        """Count a click, written to the database by the click buffer's next flush"""
+        await click_buffer.add(short_id)
     
-    def get_stats(self, limit: int = 20) -> List[URL]:
+    async def get_stats(self, limit: int = 20) -> Sequence[Row]:
         """Get statistics of the most clicked URLs"""
-        return self.repo.stats(limit)
+        return await self.repo.stats(limit)
     
-    def delete_url(self, short_id: str) -> bool:
+    async def delete_url(self, short_id: str) -> bool:
         """Delete a shortened URL"""
-        return self.repo.delete(short_id)
+        deleted = await self.repo.delete(short_id)
+        # Invalidate after the delete commits so a concurrent redirect can't re-cache the row
+        await url_cache.invalidate(short_id)
+        return deleted
     
     def generate_short_id(self) -> str:
-        """Generate a unique short ID"""
+        """Generate a random 7-character Base62 short ID from a single CSPRNG draw"""
+        number = secrets.randbelow(len(BASE62_ALPHABET) ** SHORT_ID_LENGTH)
+        chars = []
+        for _ in range(SHORT_ID_LENGTH):
+            number, digit = divmod(number, len(BASE62_ALPHABET))
+            chars.append(BASE62_ALPHABET[digit])
+        return ''.join(chars)
+    
+    async def create_with_random_id(self, target_url: str) -> URL:
+        """Insert the URL under a random short ID, retrying only if the insert collides"""
         while True:
-            short_id = shortuuid.random(length=7)
-            if not self.url_exists(short_id):
-                return short_id
+            created = await self.repo.create_unique(self.generate_short_id(), target_url)
+            if created:
+                return created
     
-    def return_target_url(self, short_id: str) -> str | None:
-        """Return the target URL of a short URL"""
-        return self.repo.return_target_url(short_id)
\ No newline at end of file
+    async def return_target_url(self, short_id: str) -> str | None:
+        """Return the target URL of a short URL, served from the cache when possible"""
+        target_url = await url_cache.get(short_id)
+        if target_url is None:
+            target_url = await self.repo.return_target_url(short_id)
+            if target_url is not None:
+                await url_cache.set(short_id, target_url)
+        return target_url
+    
+    async def resolve_target_url(self, short_id: str) -> str | None:
+        """Return the target URL of a short URL and count the click"""
+        if not CLICK_BUFFER_ENABLED:
+            # Write-through: the lookup and the increment are a single statement
+            return await self.repo.resolve_and_bump(short_id)
+
+        target_url = await self.return_target_url(short_id)
+        if target_url is not None:
+            await self.increment_clicks(short_id)
+        return target_url
\ No newline at end of file
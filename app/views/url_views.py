@@ -1,5 +1,21 @@
+import os
+from dotenv import load_dotenv
 from pydantic import BaseModel
 from datetime import datetime
+from urllib.parse import quote
+from starlette.responses import Response
+
+load_dotenv()
+
+# Same characters RedirectResponse leaves unescaped in the Location header
+LOCATION_SAFE_CHARS = ":/%#?=@[]!$&'()*+,;"
+
+# Seconds browsers and CDNs may reuse a redirect. Hits served from those caches never reach
+# the API, so their clicks aren't counted and a deleted link keeps working until it expires.
+REDIRECT_CACHE_MAX_AGE = int(os.getenv("REDIRECT_CACHE_MAX_AGE", 0))
+REDIRECT_CACHE_HEADERS = [
+    (b"cache-control", f"public, max-age={REDIRECT_CACHE_MAX_AGE}".encode("latin-1"))
+] if REDIRECT_CACHE_MAX_AGE > 0 else []
 
 class UrlStatsView(BaseModel):
     """
@@ -17,4 +33,21 @@ class UrlCreateView(BaseModel):
     """
     id: str
     target_url: str
-    short_url: str
\ No newline at end of file
+    short_url: str
+
+
+class RedirectView(Response):
+    """
+    Bodyless 307 redirect to a target URL, built straight into raw headers
+    instead of going through RedirectResponse's header handling
+    """
+    status_code = 307
+    body = b""
+    background = None
+
+    def __init__(self, target_url: str):
+        self.raw_headers = [
+            (b"location", quote(target_url, safe=LOCATION_SAFE_CHARS).encode("latin-1")),
+            (b"content-length", b"0"),
+            *REDIRECT_CACHE_HEADERS,
+        ]